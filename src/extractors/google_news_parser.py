@@ -1,32 +1,98 @@
-thonimport json
+thonimport codecs
+import json
 import logging
+import re
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Iterable, List, Optional
-from urllib.parse import urlencode, urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import quote_plus, urlencode, urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup, Tag
-from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from bs4.dammit import EncodingDetector
+
+from extractors.utils_date_filter import parse_datetime
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    # The pure-Python parser is much slower but keeps the scraper usable
+    # when lxml is not installed.
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; without it all traffic goes through requests.
+    httpx = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:
+    # selectolax is optional; without it every page goes through bs4.
+    LexborHTMLParser = None
 
 logger = logging.getLogger(__name__)
 
 GOOGLE_NEWS_BASE = "https://news.google.com"
+GOOGLE_NEWS_HOST = urlsplit(GOOGLE_NEWS_BASE).netloc
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/126.0 Safari/537.36"
+    ),
+}
+
+# Upper bound on concurrent redirect resolutions. Together with the per-host
+# spacing below, this keeps the scraper polite towards the servers it hits.
+REDIRECT_WORKERS = 16
+
+REDIRECT_STATUS_CODES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECT_HOPS = 5
+
+# Minimum spacing, in seconds, between requests to the same publisher host.
+MIN_HOST_INTERVAL = 0.05
+
+# Number of resolved article URLs remembered by each scraper instance.
+REDIRECT_CACHE_SIZE = 4096
+
+# The charset parameter of a Content-Type header.
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Elements whose strings BeautifulSoup's get_text() leaves out.
+NON_TEXT_TAGS = ["script", "style", "template", "rt", "rp"]
+
+# "By Name" bylines: the name runs up to two or more consecutive whitespace
+# characters or the end of the text, and may not exceed 80 characters so
+# whole paragraphs are never returned. The extractors join article text with
+# single spaces, so in practice this matches a byline within 80 characters
+# of the end of the article text.
+_BY_RE = re.compile(r"\bBy ([^\s][^\n]{0,79}?)(?:\s{2,}|$)")
 
 @dataclass
-class GoogleNewsArticle:
-    googleNewsUrl: str
-    articleUrl: str
-    decodedArticleUrl: Optional[str]
-    title: str
-    publishedAt: Optional[str]
-    imageUrl: Optional[str]
-    source: Optional[str]
-    sourceIconUrl: Optional[str]
-    author: Optional[str]
-
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+class ArticleParts:
+    """Elements of a single <article> that the bs4 field extractors read."""
+
+    first_link: Optional[Tag]
+    href_link: Optional[Tag]
+    time_tag: Optional[Tag]
+    imgs: List[Tag]
+    spans: List[Tag]
+    text: str
 
 class GoogleNewsScraper:
     """
@@ -45,26 +111,104 @@ class GoogleNewsScraper:
         proxies: Optional[Dict[str, str]] = None,
         user_agent: Optional[str] = None,
         decode_articles: bool = True,
+        use_selectolax: bool = True,
+        http2: bool = True,
     ) -> None:
-        self.language = language
-        self.region = region
+        self._language = language
+        self._region = region
         self.timeout = timeout
-        self.proxies = proxies
+        self._proxies = proxies
         self.decode_articles = decode_articles
+        # The C-backed lexbor parser is much faster than bs4; the bs4 path is
+        # kept for environments without selectolax and for odd layouts.
+        self.use_selectolax = use_selectolax and LexborHTMLParser is not None
 
         self.session = requests.Session()
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": f"{language}-{region},{language};q=0.9",
-            "User-Agent": user_agent
-            or (
-                "Mozilla/5.0 (X11; Linux x86_64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/126.0 Safari/537.36"
-            ),
-        }
+        # Size the connection pool so no redirect worker has to drop its
+        # keep-alive connection when the HTTP/2 client is unavailable.
+        adapter = HTTPAdapter(pool_maxsize=REDIRECT_WORKERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        headers = dict(DEFAULT_HEADERS)
+        if user_agent:
+            headers["User-Agent"] = user_agent
         self.session.headers.update(headers)
 
+        # One multiplexed HTTP/2 connection to Google carries the search page
+        # and every redirect lookup. Without httpx[http2] we stay on requests.
+        self.http2_client = self._build_http2_client(headers) if http2 else None
+        self._apply_locale()
+
+        # Politeness towards publishers: last request time per host.
+        self._host_last_request: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+        # The destination of a redirect only depends on the URL, but following
+        # it needs this scraper's HTTP clients, so the cache is per instance.
+        self._follow_redirects_cached = lru_cache(maxsize=REDIRECT_CACHE_SIZE)(
+            self._follow_redirects
+        )
+
+    def close(self) -> None:
+        """Close the HTTP/2 client and the requests session and their pooled connections."""
+        if self.http2_client is not None:
+            self.http2_client.close()
+        self.session.close()
+
+    def __enter__(self) -> "GoogleNewsScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def language(self) -> str:
+        return self._language
+
+    @language.setter
+    def language(self, value: str) -> None:
+        self._language = value
+        self._apply_locale()
+
+    @property
+    def region(self) -> str:
+        return self._region
+
+    @region.setter
+    def region(self, value: str) -> None:
+        self._region = value
+        self._apply_locale()
+
+    @property
+    def proxies(self) -> Optional[Dict[str, str]]:
+        return self._proxies
+
+    @proxies.setter
+    def proxies(self, value: Optional[Dict[str, str]]) -> None:
+        self._proxies = value
+        # httpx binds proxies to the client's transports, so swap in a new
+        # client; the requests session reads self.proxies on every call.
+        if self.http2_client is not None:
+            old_client = self.http2_client
+            self.http2_client = self._build_http2_client(dict(old_client.headers))
+            old_client.close()
+
+    def _apply_locale(self) -> None:
+        # Search URLs reuse the encoded locale parameters, so rebuild them
+        # (and Accept-Language on both clients) whenever the locale changes.
+        language, region = self._language, self._region
+        self._locale_params = urlencode(
+            {
+                "hl": f"{language}-{region}",
+                "gl": region,
+                "ceid": f"{region}:{language}",
+            }
+        )
+        accept_language = f"{language}-{region},{language};q=0.9"
+        self.session.headers["Accept-Language"] = accept_language
+        if self.http2_client is not None:
+            self.http2_client.headers["Accept-Language"] = accept_language
+
     # URL building ---------------------------------------------------------
 
     def build_search_url(self, query: str, when: Optional[str] = None) -> str:
@@ -79,76 +223,157 @@ class GoogleNewsScraper:
             # Avoid doubling the when: param if caller provided it manually.
             q = f"{q} when:{when}"
 
-        params = {
-            "q": q,
-            "hl": f"{self.language}-{self.region}",
-            "gl": self.region,
-            "ceid": f"{self.region}:{self.language}",
-        }
-        return f"{GOOGLE_NEWS_BASE}/search?{urlencode(params)}"
+        return f"{GOOGLE_NEWS_BASE}/search?q={quote_plus(q)}&{self._locale_params}"
 
     # Networking -----------------------------------------------------------
 
-    def _get(self, url: str) -> str:
+    def _build_http2_client(self, headers: Dict[str, str]) -> Optional["httpx.Client"]:
+        if httpx is None:
+            return None
+        try:
+            mounts = None
+            if self.proxies:
+                # requests-style keys ("https") become httpx patterns ("https://").
+                mounts = {
+                    (scheme if "://" in scheme else f"{scheme}://"): httpx.HTTPTransport(
+                        proxy=proxy_url, http2=True
+                    )
+                    for scheme, proxy_url in self.proxies.items()
+                }
+            return httpx.Client(http2=True, timeout=self.timeout, headers=headers, mounts=mounts)
+        except ImportError:
+            # http2=True needs the optional "h2" package.
+            logger.debug("HTTP/2 support is not installed; using requests instead")
+            return None
+
+    def _send(self, method: str, url: str, follow_redirects: bool = True, stream: bool = False) -> Any:
+        """
+        Send a request through the HTTP/2 client if available, else through
+        the requests session. Both response types expose the attributes used
+        here: status_code, headers, url, content, close() and raise_for_status().
+        """
+        if self.http2_client is not None:
+            request = self.http2_client.build_request(method, url, timeout=self.timeout)
+            return self.http2_client.send(request, follow_redirects=follow_redirects, stream=stream)
+        return self.session.request(
+            method,
+            url,
+            timeout=self.timeout,
+            allow_redirects=follow_redirects,
+            proxies=self.proxies,
+            stream=stream,
+        )
+
+    def _get(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Fetch a page and return its raw bytes along with the charset declared
+        in the Content-Type header, if any. The parsers decode the bytes
+        themselves, which avoids building an intermediate str first.
+        """
         logger.debug("Requesting Google News page: %s", url)
-        resp = self.session.get(url, timeout=self.timeout, proxies=self.proxies)
+        resp = self._send("GET", url)
         resp.raise_for_status()
-        logger.debug("Received %d bytes from Google News", len(resp.text))
-        return resp.text
+        content = resp.content
+        logger.debug("Received %d bytes from Google News", len(content))
+        match = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+        return content, match.group(1) if match else None
+
+    def _throttle_host(self, url: str) -> None:
+        """
+        Keep requests to the same publisher host at least MIN_HOST_INTERVAL
+        apart. Google's own hops are not delayed; only the destination
+        servers reached while resolving redirects need the courtesy.
+        """
+        host = urlsplit(url).netloc
+        if host == GOOGLE_NEWS_HOST:
+            return
+        with self._host_lock:
+            now = time.monotonic()
+            last = self._host_last_request.get(host)
+            # Reserve the next free slot under the lock so concurrent workers
+            # hitting the same host queue up instead of firing together.
+            slot = now if last is None else max(now, last + MIN_HOST_INTERVAL)
+            self._host_last_request[host] = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _follow_redirects(self, url: str) -> str:
+        """
+        Follow the redirect chain starting at `url` and return the final URL.
+
+        Redirects are followed by hand with HEAD requests, reading only the
+        Location header of each hop, so no response bodies are downloaded on
+        the happy path. Network errors, rate limits (429) and server errors
+        (5xx) raise, so transient failures are never cached.
+        """
+        current = url
+        for _ in range(MAX_REDIRECT_HOPS):
+            self._throttle_host(current)
+            resp = self._send("HEAD", current, follow_redirects=False)
+            if resp.status_code in (405, 501):
+                # HEAD is not supported here; stream a GET so the body is
+                # never read, only the status line and headers.
+                self._throttle_host(current)
+                resp = self._send("GET", current, follow_redirects=False, stream=True)
+                resp.close()
+            if resp.status_code == 429 or resp.status_code >= 500:
+                # Rate limits and server errors are transient: raise so the
+                # lookup is not cached. Other 4xx answers (bot protection,
+                # missing pages) still identify the URL we reached.
+                resp.raise_for_status()
+
+            location = resp.headers.get("Location")
+            if resp.status_code not in REDIRECT_STATUS_CODES or not location:
+                return current
+            current = urljoin(str(resp.url), location)
+        return current
 
     def _resolve_redirect(self, url: str) -> Optional[str]:
         """
         Resolve Google News redirect links to the final destination URL.
 
-        This uses a HEAD/GET with redirects enabled. It is safe but may be
-        slower on very large result sets, so callers can disable via config.
+        Successful resolutions are cached per scraper, so reusing one instance
+        across queries avoids re-resolving articles that show up again.
+        Callers can disable resolution entirely via config.
         """
         try:
             logger.debug("Resolving article redirect: %s", url)
-            # HEAD first – some servers may not support it, so fall back to GET.
-            resp = self.session.head(
-                url,
-                timeout=self.timeout,
-                allow_redirects=True,
-                proxies=self.proxies,
-            )
-            if resp.is_redirect or resp.history:
-                return resp.url
-
-            # Some servers ignore HEAD's redirect history; do a GET if needed.
-            if resp.status_code >= 400:
-                resp = self.session.get(
-                    url,
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                    proxies=self.proxies,
-                )
-            return resp.url
+            return self._follow_redirects_cached(url)
         except Exception as exc:  # noqa: BLE001
             logger.debug("Failed to resolve redirect for %s: %s", url, exc)
             return None
 
+    def _resolve_redirects(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Resolve many redirect links concurrently, preserving the input order.
+
+        Resolution is almost entirely network wait, so a small pool of threads
+        sharing the scraper's HTTP connections overlaps the round-trips instead
+        of paying them one after another.
+        """
+        # Duplicate links are resolved once and shared.
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return []
+
+        resolved: Dict[str, Optional[str]] = {}
+        with ThreadPoolExecutor(max_workers=min(REDIRECT_WORKERS, len(unique_urls))) as pool:
+            futures = {pool.submit(self._resolve_redirect, url): url for url in unique_urls}
+            for future in as_completed(futures):
+                resolved[futures[future]] = future.result()
+        return [resolved[url] for url in urls]
+
     # Parsing --------------------------------------------------------------
 
     def _extract_article_elements(self, soup: BeautifulSoup) -> Iterable[Tag]:
         # Google uses <article> tags for each item as of this implementation.
         # This may change over time; we keep the selector simple and robust.
-        for article in soup.find_all("article"):
-            yield article
-
-    @staticmethod
-    def _extract_title(article: Tag) -> str:
-        link = article.find("a")
-        if not isinstance(link, Tag):
-            return ""
-        return link.get_text(strip=True)
+        # The soup is parsed with an <article> strainer, so the items are
+        # already the top-level elements.
+        return soup.find_all("article", recursive=False)
 
     @staticmethod
-    def _extract_raw_article_url(article: Tag) -> Optional[str]:
-        link = article.find("a", href=True)
-        if not isinstance(link, Tag):
-            return None
-        href = link["href"]
+    def _normalize_article_url(href: str) -> str:
         # Google News uses relative paths like "./articles/..."
         if href.startswith("./") or href.startswith("/"):
             return urljoin(GOOGLE_NEWS_BASE, href.lstrip("./"))
@@ -157,80 +382,221 @@ class GoogleNewsScraper:
         return urljoin(GOOGLE_NEWS_BASE, href)
 
     @staticmethod
-    def _extract_published_at(article: Tag) -> Optional[str]:
-        # Prefer ISO-8601 datetime attribute if available.
-        time_tag = article.find("time")
-        if isinstance(time_tag, Tag):
-            datetime_attr = time_tag.get("datetime")
-            if datetime_attr:
-                return datetime_attr
-            text = time_tag.get_text(strip=True)
-            if text:
-                try:
-                    dt = date_parser.parse(text, fuzzy=True)
-                    return dt.isoformat()
-                except Exception:  # noqa: BLE001
-                    return text
-        return None
+    def _parse_time_text(text: str) -> Optional[str]:
+        if not text:
+            return None
+        try:
+            dt = parse_datetime(text, fuzzy=True)
+            return dt.isoformat()
+        except Exception:  # noqa: BLE001
+            return text
 
     @staticmethod
-    def _extract_source(article: Tag) -> Optional[str]:
-        # Sources are usually in a <div> or <span> near the time element.
-        # We search for the first eligible span containing non-empty text.
-        candidates = article.find_all("span")
-        for span in candidates:
-            txt = span.get_text(strip=True)
+    def _pick_source(span_texts: Iterable[str]) -> Optional[str]:
+        for txt in span_texts:
             if txt and len(txt.split()) <= 5:
                 # Heuristic: source names are short (e.g. "MyLondon")
                 return txt
         return None
 
     @staticmethod
-    def _extract_image(article: Tag) -> Optional[str]:
-        img = article.find("img")
-        if not isinstance(img, Tag):
-            return None
-        return img.get("src") or img.get("data-src")
-
-    @staticmethod
-    def _extract_source_icon(article: Tag) -> Optional[str]:
-        # Some layouts expose source icons as small <img> elements.
-        imgs = article.find_all("img")
-        if not imgs:
-            return None
+    def _pick_source_icon(img_attrs: Iterable[Mapping[str, Any]]) -> Optional[str]:
         # Heuristic: icon-sized images tend to be the smallest.
         smallest = None
         smallest_area = None
-        for img in imgs:
-            w = img.get("width")
-            h = img.get("height")
+        for attrs in img_attrs:
+            w = attrs.get("width")
+            h = attrs.get("height")
             try:
                 area = int(w) * int(h)
             except Exception:  # noqa: BLE001
                 continue
             if smallest is None or area < smallest_area:
-                smallest = img
+                smallest = attrs
                 smallest_area = area
         if smallest is None:
             return None
         return smallest.get("src") or smallest.get("data-src")
 
     @staticmethod
-    def _extract_author(article: Tag) -> Optional[str]:
+    def _pick_author(text: str) -> Optional[str]:
+        match = _BY_RE.search(text)
+        if match is None:
+            return None
+        return "By " + match.group(1).strip()
+
+    @staticmethod
+    def _collect_parts(article: Tag) -> ArticleParts:
+        # Walk the article subtree once and keep everything the extractors
+        # need, instead of running a separate find/find_all per field.
+        first_link: Optional[Tag] = None
+        href_link: Optional[Tag] = None
+        time_tag: Optional[Tag] = None
+        imgs: List[Tag] = []
+        spans: List[Tag] = []
+        texts: List[str] = []
+        for node in article.descendants:
+            if isinstance(node, Tag):
+                name = node.name
+                if name == "a":
+                    if first_link is None:
+                        first_link = node
+                    if href_link is None and node.get("href") is not None:
+                        href_link = node
+                elif name == "time":
+                    if time_tag is None:
+                        time_tag = node
+                elif name == "img":
+                    imgs.append(node)
+                elif name == "span":
+                    spans.append(node)
+            # Exact type check: comments, scripts and styles are
+            # NavigableString subclasses that get_text() leaves out too.
+            elif type(node) is NavigableString:
+                text = node.strip()
+                if text:
+                    texts.append(text)
+        return ArticleParts(
+            first_link=first_link,
+            href_link=href_link,
+            time_tag=time_tag,
+            imgs=imgs,
+            spans=spans,
+            text=" ".join(texts),
+        )
+
+    @staticmethod
+    def _extract_title(parts: ArticleParts) -> str:
+        if parts.first_link is None:
+            return ""
+        return parts.first_link.get_text(strip=True)
+
+    @classmethod
+    def _extract_raw_article_url(cls, parts: ArticleParts) -> Optional[str]:
+        if parts.href_link is None:
+            return None
+        return cls._normalize_article_url(parts.href_link["href"])
+
+    @classmethod
+    def _extract_published_at(cls, parts: ArticleParts) -> Optional[str]:
+        # Prefer ISO-8601 datetime attribute if available.
+        time_tag = parts.time_tag
+        if time_tag is not None:
+            datetime_attr = time_tag.get("datetime")
+            if datetime_attr:
+                return datetime_attr
+            return cls._parse_time_text(time_tag.get_text(strip=True))
+        return None
+
+    @classmethod
+    def _extract_source(cls, spans: List[Tag]) -> Optional[str]:
+        # Sources are usually in a <div> or <span> near the time element.
+        # We search for the first eligible span containing non-empty text.
+        return cls._pick_source(span.get_text(strip=True) for span in spans)
+
+    @staticmethod
+    def _extract_image(imgs: List[Tag]) -> Optional[str]:
+        if not imgs:
+            return None
+        return imgs[0].get("src") or imgs[0].get("data-src")
+
+    @classmethod
+    def _extract_source_icon(cls, imgs: List[Tag]) -> Optional[str]:
+        # Some layouts expose source icons as small <img> elements.
+        return cls._pick_source_icon(img.attrs for img in imgs)
+
+    @classmethod
+    def _extract_author(cls, parts: ArticleParts) -> Optional[str]:
         # Authors are uncommon in Google News search results but may appear as
         # "By Name" somewhere in the metadata.
-        text = article.get_text(separator=" ", strip=True)
-        if not text:
+        return cls._pick_author(parts.text)
+
+    def _extract_fields(self, article: Tag, search_url: str) -> Optional[Dict[str, Any]]:
+        parts = self._collect_parts(article)
+        raw_url = self._extract_raw_article_url(parts)
+        if not raw_url:
             return None
-        marker = "By "
-        idx = text.find(marker)
-        if idx == -1:
+        return {
+            "googleNewsUrl": search_url,
+            "articleUrl": raw_url,
+            "decodedArticleUrl": None,
+            "title": self._extract_title(parts),
+            "publishedAt": self._extract_published_at(parts),
+            "imageUrl": self._extract_image(parts.imgs),
+            "source": self._extract_source(parts.spans),
+            "sourceIconUrl": self._extract_source_icon(parts.imgs),
+            "author": self._extract_author(parts),
+        }
+
+    @staticmethod
+    def _lexbor_article_elements(html: bytes, encoding: Optional[str]) -> List["LexborNode"]:
+        # lexbor always decodes bytes as UTF-8, so pages declaring another
+        # charset (in the header or a <meta> tag) are decoded here first.
+        encoding = encoding or EncodingDetector.find_declared_encoding(html, is_html=True)
+        if encoding:
+            try:
+                if codecs.lookup(encoding).name != "utf-8":
+                    html = html.decode(encoding, errors="replace")
+            except LookupError:
+                logger.debug("Unknown page charset %r; decoding as UTF-8", encoding)
+        tree = LexborHTMLParser(html)
+        # bs4's get_text() skips script, style, template and ruby annotation
+        # strings, while lexbor's text() includes them. Drop those elements
+        # up front so every lexbor field sees the same text as bs4.
+        tree.strip_tags(NON_TEXT_TAGS)
+        # Only top-level articles, matching the bs4 path: a nested <article>
+        # is part of its parent's record, not an item of its own.
+        return tree.css("article:not(article article)")
+
+    @staticmethod
+    def _lexbor_text(node: "LexborNode") -> str:
+        # Mirror bs4's get_text(separator=" ", strip=True): lexbor keeps
+        # whitespace-only text nodes as empty parts, bs4 drops them.
+        parts = node.text(separator="\x00", strip=True).split("\x00")
+        return " ".join(part for part in parts if part)
+
+    def _extract_fields_lexbor(self, article: "LexborNode", search_url: str) -> Optional[Dict[str, Any]]:
+        # A single grouped query returns every node of interest in document
+        # order, instead of one subtree walk per selector.
+        first_link = href_link = time_node = None
+        imgs: List[Dict[str, Any]] = []
+        spans: List["LexborNode"] = []
+        for node in article.css("a, time, img, span"):
+            tag = node.tag
+            if tag == "a":
+                if first_link is None:
+                    first_link = node
+                if href_link is None and "href" in node.attributes:
+                    href_link = node
+            elif tag == "time":
+                if time_node is None:
+                    time_node = node
+            elif tag == "img":
+                imgs.append(node.attributes)
+            else:
+                spans.append(node)
+
+        if href_link is None:
             return None
-        segment = text[idx + len(marker) :].split("  ")[0].strip()
-        # Limit length to avoid returning whole paragraphs.
-        if segment and len(segment) <= 80:
-            return "By " + segment
-        return None
+        raw_url = self._normalize_article_url(href_link.attributes.get("href") or "")
+
+        published_at = None
+        if time_node is not None:
+            published_at = time_node.attributes.get("datetime") or self._parse_time_text(
+                time_node.text(strip=True)
+            )
+
+        return {
+            "googleNewsUrl": search_url,
+            "articleUrl": raw_url,
+            "decodedArticleUrl": None,
+            "title": first_link.text(strip=True) if first_link is not None else "",
+            "publishedAt": published_at,
+            "imageUrl": (imgs[0].get("src") or imgs[0].get("data-src")) if imgs else None,
+            "source": self._pick_source(span.text(strip=True) for span in spans),
+            "sourceIconUrl": self._pick_source_icon(imgs),
+            "author": self._pick_author(self._lexbor_text(article)),
+        }
 
     # Public API -----------------------------------------------------------
 
@@ -250,42 +616,42 @@ class GoogleNewsScraper:
             limit is reached.
         """
         search_url = self.build_search_url(query, when=when)
-        html = self._get(search_url)
-        soup = BeautifulSoup(html, "html.parser")
+        html, encoding = self._get(search_url)
+        if self.use_selectolax:
+            article_nodes: Iterable[Any] = self._lexbor_article_elements(html, encoding)
+            extract_fields = self._extract_fields_lexbor
+        else:
+            soup = BeautifulSoup(
+                html,
+                HTML_PARSER,
+                parse_only=SoupStrainer("article"),
+                from_encoding=encoding,
+            )
+            article_nodes = self._extract_article_elements(soup)
+            extract_fields = self._extract_fields
 
-        articles: List[GoogleNewsArticle] = []
-        for article_tag in self._extract_article_elements(soup):
-            raw_url = self._extract_raw_article_url(article_tag)
-            if not raw_url:
+        articles: List[Dict[str, Any]] = []
+        for article_node in article_nodes:
+            item = extract_fields(article_node, search_url)
+            if item is None:
                 continue
-
-            decoded_url: Optional[str] = None
-            if self.decode_articles:
-                decoded_url = self._resolve_redirect(raw_url)
-                # Be kind to servers when resolving many redirects.
-                time.sleep(0.05)
-
-            item = GoogleNewsArticle(
-                googleNewsUrl=search_url,
-                articleUrl=raw_url,
-                decodedArticleUrl=decoded_url,
-                title=self._extract_title(article_tag),
-                publishedAt=self._extract_published_at(article_tag),
-                imageUrl=self._extract_image(article_tag),
-                source=self._extract_source(article_tag),
-                sourceIconUrl=self._extract_source_icon(article_tag),
-                author=self._extract_author(article_tag),
-            )
             articles.append(item)
 
             if len(articles) >= max_items:
                 break
 
+        if self.decode_articles:
+            decoded_urls = self._resolve_redirects([a["articleUrl"] for a in articles])
+            for article, decoded_url in zip(articles, decoded_urls):
+                article["decodedArticleUrl"] = decoded_url
+
         logger.info("Parsed %d articles from Google News", len(articles))
-        return [a.to_dict() for a in articles]
+        return articles
 
     # Debug helpers --------------------------------------------------------
 
     @staticmethod
     def to_pretty_json(articles: Iterable[Dict[str, Any]]) -> str:
+        if orjson is not None:
+            return orjson.dumps(list(articles), option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(list(articles), indent=2, ensure_ascii=False)
\ No newline at end of file
@@ -2,12 +2,30 @@ thonfrom __future__ import annotations
 
 import datetime as dt
 import logging
+import re
 from typing import Any, Dict, Iterable, List, Optional
 
 from dateutil import parser as date_parser
 
 logger = logging.getLogger(__name__)
 
+# Cheap pre-check for timestamps the stdlib ISO-8601 parser can handle.
+_FAST_ISO = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2})?")
+
+def parse_datetime(value: str, fuzzy: bool = False) -> dt.datetime:
+    """
+    Parse a timestamp string into a datetime.
+
+    ISO-8601 values (what Google News emits) go through the fast stdlib
+    parser; anything else falls back to dateutil, which is much slower.
+    """
+    if _FAST_ISO.match(value):
+        try:
+            return dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return date_parser.parse(value, fuzzy=fuzzy)
+
 def build_time_range(
     hours: Optional[int] = None,
     days: Optional[int] = None,
@@ -47,6 +65,35 @@ def parse_since_from_relative_config(cfg: Dict[str, Any]) -> Optional[dt.datetim
         return now - dt.timedelta(days=int(years) * 365)
     return None
 
+def _published_timestamp(art: Dict[str, Any]) -> Optional[int]:
+    """
+    Return an article's 'publishedAt' as whole POSIX seconds, or None if it
+    is missing or cannot be parsed. Naive timestamps are taken as UTC.
+    """
+    published_raw = art.get("publishedAt")
+    if not published_raw:
+        return None
+
+    try:
+        parsed_dt = parse_datetime(str(published_raw))
+        if parsed_dt.tzinfo is None:
+            parsed_dt = parsed_dt.replace(tzinfo=dt.timezone.utc)
+        # Aware datetimes convert to epoch seconds directly; no need to
+        # normalise them to UTC first.
+        return int(parsed_dt.timestamp())
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(
+            "Failed to parse publishedAt '%s': %s. Keeping article.",
+            published_raw,
+            exc,
+        )
+        return None
+
+def _is_published_since(art: Dict[str, Any], since_ts: int) -> bool:
+    published_ts = _published_timestamp(art)
+    # Articles without a usable timestamp are kept.
+    return published_ts is None or published_ts >= since_ts
+
 def filter_articles_by_published_at(
     articles: Iterable[Dict[str, Any]],
     since: dt.datetime,
@@ -56,31 +103,5 @@ def filter_articles_by_published_at(
     timestamp greater than or equal to 'since'. If parsing fails, the item
     is kept (to avoid accidentally losing data).
     """
-    since_utc = since.astimezone(dt.timezone.utc)
-    filtered: List[Dict[str, Any]] = []
-
-    for art in articles:
-        published_raw = art.get("publishedAt")
-        if not published_raw:
-            filtered.append(art)
-            continue
-
-        try:
-            parsed_dt = date_parser.parse(str(published_raw))
-            if parsed_dt.tzinfo is None:
-                parsed_dt = parsed_dt.replace(tzinfo=dt.timezone.utc)
-            else:
-                parsed_dt = parsed_dt.astimezone(dt.timezone.utc)
-        except Exception as exc:  # noqa: BLE001
-            logger.debug(
-                "Failed to parse publishedAt '%s': %s. Keeping article.",
-                published_raw,
-                exc,
-            )
-            filtered.append(art)
-            continue
-
-        if parsed_dt >= since_utc:
-            filtered.append(art)
-
-    return filtered
\ No newline at end of file
+    since_ts = int(since.timestamp())
+    return [art for art in articles if _is_published_since(art, since_ts)]
@@ -13,6 +13,11 @@ from extractors.utils_date_filter import (
 )
 from outputs.exporters import export_to_json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 def setup_logging(verbose: bool = False) -> None:
@@ -32,8 +37,8 @@ def load_settings(config_path: Optional[Path]) -> Dict[str, Any]:
         return {}
 
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = config_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.debug("Loaded settings from %s", config_path)
         return data
     except json.JSONDecodeError as exc:
@@ -85,6 +90,12 @@ def merge_cli_with_settings(args: argparse.Namespace, settings: Dict[str, Any])
     else:
         result["decode_articles"] = settings.get("decode_articles", True)
 
+    # HTML parser backend
+    if args.no_selectolax:
+        result["use_selectolax"] = False
+    else:
+        result["use_selectolax"] = settings.get("use_selectolax", True)
+
     return result
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -141,6 +152,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Disable decoding article redirect URLs to the final destination.",
     )
+    parser.add_argument(
+        "--no-selectolax",
+        action="store_true",
+        help="Parse result pages with BeautifulSoup even if selectolax is installed.",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -162,6 +178,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     network_cfg = effective.get("network", {})
     timeout = int(network_cfg.get("timeout", 10))
     proxies = network_cfg.get("proxies") or None
+    http2 = bool(network_cfg.get("http2", True))
     user_agent = network_cfg.get(
         "user_agent",
         "Mozilla/5.0 (X11; Linux x86_64) "
@@ -176,6 +193,8 @@ def main(argv: Optional[List[str]] = None) -> None:
         proxies=proxies,
         user_agent=user_agent,
         decode_articles=effective["decode_articles"],
+        use_selectolax=effective["use_selectolax"],
+        http2=http2,
     )
 
     relative_time_cfg = effective.get("relative_time", {})
@@ -195,6 +214,8 @@ def main(argv: Optional[List[str]] = None) -> None:
     except Exception as exc:  # noqa: BLE001
         logger.error("Scraping failed: %s", exc)
         sys.exit(1)
+    finally:
+        scraper.close()
 
     if since_dt is not None:
         logger.info("Filtering articles published since %s", since_dt.isoformat())
@@ -3,6 +3,12 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Union
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib encoder writes the same JSON, only slower.
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -27,6 +33,13 @@ def export_to_json(
     _ensure_parent_dir(output_path)
 
     logger.info("Writing %d articles to JSON file %s", len(articles), output_path)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, matching ensure_ascii=False.
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with output_path.open("wb") as f:
+            f.write(orjson.dumps(articles, option=option))
+        return
+
     with output_path.open("w", encoding="utf-8") as f:
         if pretty:
             json.dump(articles, f, indent=2, ensure_ascii=False)